@@ -28,6 +28,8 @@ class PPOCatalog(Catalog):
     build custom heads during RLModule runtime.
     """
 
+    __slots__ = ("actor_critic_encoder_config", "pi_head_config", "vf_head_config")
+
     def __init__(
         self,
         observation_space: gym.Space,
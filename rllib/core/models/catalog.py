@@ -1,4 +1,6 @@
-from typing import Optional, Mapping, Any
+import functools
+from types import MappingProxyType
+from typing import Optional, Mapping, Any, Callable
 
 import numpy as np
 import gymnasium as gym
@@ -27,6 +29,204 @@ from ray.rllib.utils.error import UnsupportedSpaceException
 from ray.rllib.utils.spaces.simplex import Simplex
 
 
+def _classify_obs(space: gym.Space) -> str:
+    """Classifies an observation space for the purpose of picking an encoder.
+
+    Args:
+        space: The observation space to classify.
+
+    Returns:
+        "box1d" for 1D Boxes, "box3d" for 3D Boxes and "nested" for anything else,
+        e.g. a possibly nested structure of spaces.
+    """
+    if isinstance(space, Box):
+        shape = space.shape
+        if len(shape) == 1:
+            return "box1d"
+        elif len(shape) == 3:
+            return "box3d"
+    return "nested"
+
+
+@functools.lru_cache(maxsize=32)
+def _default_filter_config(shape: tuple) -> tuple:
+    """Returns `get_filter_config(shape)` as a cached, immutable tuple of tuples."""
+    return tuple(
+        tuple(tuple(x) if isinstance(x, list) else x for x in filter_specifier)
+        for filter_specifier in get_filter_config(shape)
+    )
+
+
+def _cached_filter_config(shape: tuple) -> list:
+    """Cached version of `get_filter_config()`.
+
+    Returns fresh lists on every call, so the result can be modified by the caller.
+    """
+    return [
+        [list(x) if isinstance(x, tuple) else x for x in filter_specifier]
+        for filter_specifier in _default_filter_config(shape)
+    ]
+
+
+# Characters of all numpy integer dtypes (see `np.dtype.char`).
+_INT_TYPECODES = frozenset(np.typecodes["AllInteger"])
+
+# Read-only, so that the constant can't be modified through its callers.
+_DISTRIBUTION_DICTS = MappingProxyType(
+    {
+        "deterministic": MappingProxyType(
+            {"torch": TorchDeterministic, "tf": TfDeterministic}
+        ),
+        "gaussian": MappingProxyType(
+            {"torch": TorchDiagGaussian, "tf": TfDiagGaussian}
+        ),
+        "categorical": MappingProxyType(
+            {"torch": TorchCategorical, "tf": TfCategorical}
+        ),
+    }
+)
+
+
+def _handle_box(action_space: Box, deterministic: bool) -> Mapping[str, Any]:
+    """Box space -> DiagGaussian OR Deterministic."""
+    if action_space.dtype.char in _INT_TYPECODES:
+        raise ValueError(
+            "Box(..., `int`) action spaces are not supported. "
+            "Use MultiDiscrete  or Box(..., `float`)."
+        )
+    if len(action_space.shape) > 1:
+        raise UnsupportedSpaceException(
+            "Action space has multiple dimensions "
+            "{}. ".format(action_space.shape)
+            + "Consider reshaping this into a single dimension, "
+            "using a custom action distribution, "
+            "using a Tuple action space, or the multi-agent API."
+        )
+    if deterministic:
+        return _DISTRIBUTION_DICTS["deterministic"]
+    else:
+        return _DISTRIBUTION_DICTS["gaussian"]
+
+
+def _handle_discrete(action_space: Discrete, deterministic: bool) -> Mapping[str, Any]:
+    """Discrete Space -> Categorical."""
+    return _DISTRIBUTION_DICTS["categorical"]
+
+
+def _raise_not_implemented(message: str) -> Callable:
+    """Returns a handler for action spaces that are not supported yet."""
+
+    def handler(action_space: gym.Space, deterministic: bool):
+        raise NotImplementedError(message)
+
+    return handler
+
+
+# Maps action space types to functions that return the mapping from framework to
+# action distribution class for a given action space. Insertion order determines
+# the order of the isinstance fallback for subclasses of these types.
+_ACTION_SPACE_HANDLERS = {
+    Box: _handle_box,
+    Discrete: _handle_discrete,
+    # Tuple/Dict Spaces -> MultiAction.
+    # TODO(Artur): Supported Tuple/Dict.
+    Tuple: _raise_not_implemented("Tuple/Dict spaces not yet supported."),
+    Dict: _raise_not_implemented("Tuple/Dict spaces not yet supported."),
+    # Simplex -> Dirichlet.
+    # TODO(Artur): Supported Simplex (in torch).
+    Simplex: _raise_not_implemented("Simplex action space not yet supported."),
+    # MultiDiscrete -> MultiCategorical.
+    # TODO(Artur): Support multi-discrete.
+    MultiDiscrete: _raise_not_implemented("MultiDiscrete spaces not yet supported."),
+}
+
+
+def _build_lstm_encoder_config(
+    model_config_dict: dict,
+    observation_space: gym.Space,
+    action_space: gym.Space,
+    view_requirements,
+    get_tokenizer_config: Callable[[gym.Space, dict], ModelConfig],
+) -> ModelConfig:
+    """Builds the LSTMEncoderConfig for Catalog.get_encoder_config()."""
+    lstm_cell_size = model_config_dict["lstm_cell_size"]
+    return LSTMEncoderConfig(
+        hidden_dim=lstm_cell_size,
+        batch_first=not model_config_dict["_time_major"],
+        num_layers=1,
+        output_dim=lstm_cell_size,
+        output_activation=model_config_dict["fcnet_activation"],
+        observation_space=observation_space,
+        action_space=action_space,
+        view_requirements_dict=view_requirements,
+        get_tokenizer_config=get_tokenizer_config,
+    )
+
+
+def _build_mlp_encoder_config(
+    model_config_dict: dict, observation_space: Box
+) -> ModelConfig:
+    """Builds the MLPEncoderConfig for 1D Box inputs."""
+    activation = model_config_dict["fcnet_activation"]
+    fcnet_hiddens = model_config_dict["fcnet_hiddens"]
+    configured_latent_dim = model_config_dict["encoder_latent_dim"]
+    # In order to guarantee backward compatability with old configs,
+    # we need to check if no latent dim was set and simply reuse the last
+    # fcnet hidden dim for that purpose.
+    if configured_latent_dim:
+        hidden_layer_dims = fcnet_hiddens
+    else:
+        hidden_layer_dims = fcnet_hiddens[:-1]
+    return MLPEncoderConfig(
+        input_dim=observation_space.shape[0],
+        hidden_layer_dims=hidden_layer_dims,
+        hidden_layer_activation=activation,
+        output_dim=configured_latent_dim or fcnet_hiddens[-1],
+        output_activation=activation,
+    )
+
+
+def _build_cnn_encoder_config(
+    model_config_dict: dict, observation_space: Box
+) -> ModelConfig:
+    """Builds the CNNEncoderConfig for 3D Box inputs."""
+    activation = model_config_dict["fcnet_activation"]
+    # Don't write the default filters back into model_config_dict, which
+    # may be the caller's (already merged) dict.
+    filter_specifiers = model_config_dict.get("conv_filters")
+    if not filter_specifiers:
+        filter_specifiers = _cached_filter_config(tuple(observation_space.shape))
+    return CNNEncoderConfig(
+        input_dims=observation_space.shape,
+        filter_specifiers=filter_specifiers,
+        filter_layer_activation=activation,
+        output_activation=activation,
+        output_dim=(
+            model_config_dict["encoder_latent_dim"]
+            or model_config_dict["fcnet_hiddens"][-1]
+        ),
+    )
+
+
+def _raise_nested(model_config_dict: dict, observation_space: gym.Space):
+    """Complex observation spaces don't have a default encoder config yet."""
+    # NestedModelConfig
+    raise NotImplementedError("No default config for complex spaces yet!")
+
+
+# Maps the kind of observation space (see `_classify_obs()`) to the function that
+# builds the default (non-recurrent) encoder config for it.
+# TODO (Artur): Maybe check for original spaces here
+_ENCODER_CONFIG_BUILDERS = {
+    # input_space is a 1D Box
+    "box1d": _build_mlp_encoder_config,
+    # input_space is a 3D Box
+    "box3d": _build_cnn_encoder_config,
+    # input_space is a possibly nested structure of spaces.
+    "nested": _raise_nested,
+}
+
+
 class Catalog:
     """Describes the sub-modules architectures to be used in RLModules.
 
@@ -36,6 +236,8 @@ class Catalog:
     overriding the build_* methods. Alternatively, you can customize the configs
     inside RLlib's Catalogs to customize what is being built by RLlib.
 
+    Catalog uses `__slots__`; subclasses without their own get a regular `__dict__`.
+
     Usage example:
 
     # Define a custom catalog
@@ -70,6 +272,16 @@ class Catalog:
         out = my_head(...)  # doctest: +SKIP
     """
 
+    __slots__ = (
+        "observation_space",
+        "action_space",
+        "model_config_dict",
+        "view_requirements",
+        "encoder_config",
+        "action_dist_cls_dict",
+        "latent_dim",
+    )
+
     def __init__(
         self,
         observation_space: gym.Space,
@@ -98,11 +310,17 @@ class Catalog:
         self.model_config_dict = {**MODEL_DEFAULTS, **model_config_dict}
         self.view_requirements = view_requirements
 
-        # Produce a basic encoder config.
-        self.encoder_config = self.get_encoder_config(
+        # Produce a basic encoder config. self.model_config_dict is already merged,
+        # so skip merging it again, unless a subclass overrides get_encoder_config().
+        get_encoder_config_fn = getattr(self.get_encoder_config, "__func__", None)
+        if get_encoder_config_fn is Catalog.get_encoder_config.__func__:
+            get_encoder_config = self._get_encoder_config_from_merged
+        else:
+            get_encoder_config = self.get_encoder_config
+        self.encoder_config = get_encoder_config(
             observation_space=observation_space,
             action_space=action_space,
-            model_config_dict=model_config_dict,
+            model_config_dict=self.model_config_dict,
             view_requirements=view_requirements,
         )
 
@@ -164,70 +382,47 @@ class Catalog:
             The encoder config.
         """
         # TODO (Artur): Make it so that we don't work with complete MODEL_DEFAULTS
-        model_config_dict = {**MODEL_DEFAULTS, **model_config_dict}
-
-        activation = model_config_dict["fcnet_activation"]
-        output_activation = model_config_dict["fcnet_activation"]
-        fcnet_hiddens = model_config_dict["fcnet_hiddens"]
-        encoder_latent_dim = (
-            model_config_dict["encoder_latent_dim"] or fcnet_hiddens[-1]
+        return cls._get_encoder_config_from_merged(
+            observation_space,
+            {**MODEL_DEFAULTS, **model_config_dict},
+            action_space,
+            view_requirements,
         )
 
+    @classmethod
+    def _get_encoder_config_from_merged(
+        cls,
+        observation_space: gym.Space,
+        model_config_dict: dict,
+        action_space: gym.Space = None,
+        view_requirements=None,
+    ) -> ModelConfig:
+        """Implements get_encoder_config() for an already merged model_config_dict.
+
+        Args:
+            observation_space: The observation space to use.
+            model_config_dict: The model config to use, which must already contain
+                all MODEL_DEFAULTS.
+            action_space: The action space to use if actions are to be encoded.
+            view_requirements: The view requirements to use if anything else than
+                observation_space or action_space is to be encoded.
+
+        Returns:
+            The encoder config.
+        """
         if model_config_dict["use_lstm"]:
-            encoder_config = LSTMEncoderConfig(
-                hidden_dim=model_config_dict["lstm_cell_size"],
-                batch_first=not model_config_dict["_time_major"],
-                num_layers=1,
-                output_dim=model_config_dict["lstm_cell_size"],
-                output_activation=output_activation,
-                observation_space=observation_space,
-                action_space=action_space,
-                view_requirements_dict=view_requirements,
+            return _build_lstm_encoder_config(
+                model_config_dict,
+                observation_space,
+                action_space,
+                view_requirements,
                 get_tokenizer_config=cls.get_tokenizer_config,
             )
         elif model_config_dict["use_attention"]:
             raise NotImplementedError
-        else:
-            # TODO (Artur): Maybe check for original spaces here
-            # input_space is a 1D Box
-            if isinstance(observation_space, Box) and len(observation_space.shape) == 1:
-                # In order to guarantee backward compatability with old configs,
-                # we need to check if no latent dim was set and simply reuse the last
-                # fcnet hidden dim for that purpose.
-                if model_config_dict["encoder_latent_dim"]:
-                    hidden_layer_dims = model_config_dict["fcnet_hiddens"]
-                else:
-                    hidden_layer_dims = model_config_dict["fcnet_hiddens"][:-1]
-                encoder_config = MLPEncoderConfig(
-                    input_dim=observation_space.shape[0],
-                    hidden_layer_dims=hidden_layer_dims,
-                    hidden_layer_activation=activation,
-                    output_dim=encoder_latent_dim,
-                    output_activation=output_activation,
-                )
-
-            # input_space is a 3D Box
-            elif (
-                isinstance(observation_space, Box) and len(observation_space.shape) == 3
-            ):
-                if not model_config_dict.get("conv_filters"):
-                    model_config_dict["conv_filters"] = get_filter_config(
-                        observation_space.shape
-                    )
-
-                encoder_config = CNNEncoderConfig(
-                    input_dims=observation_space.shape,
-                    filter_specifiers=model_config_dict["conv_filters"],
-                    filter_layer_activation=activation,
-                    output_activation=output_activation,
-                    output_dim=encoder_latent_dim,
-                )
-            # input_space is a possibly nested structure of spaces.
-            else:
-                # NestedModelConfig
-                raise NotImplementedError("No default config for complex spaces yet!")
-
-        return encoder_config
+        return _ENCODER_CONFIG_BUILDERS[_classify_obs(observation_space)](
+            model_config_dict, observation_space
+        )
 
     @classmethod
     def get_tokenizer_config(
@@ -239,12 +434,13 @@ class Catalog:
         By default, RLlib uses the models supported by Catalog out of the box to
         tokenize.
         """
+        # Use model_config_dict without flags that would end up in complex models
         return cls.get_encoder_config(
             observation_space=space,
-            # Use model_config_dict without flags that would end up in complex models
             model_config_dict={
                 **model_config_dict,
-                **{"use_lstm": False, "use_attention": False},
+                "use_lstm": False,
+                "use_attention": False,
             },
         )
 
@@ -273,55 +469,19 @@ class Catalog:
         Returns:
                 Mapping from framework to distribution class.
         """
-        distribution_dicts = {
-            "deterministic": {"torch": TorchDeterministic, "tf": TfDeterministic},
-            "gaussian": {"torch": TorchDiagGaussian, "tf": TfDiagGaussian},
-            "categorical": {"torch": TorchCategorical, "tf": TfCategorical},
-        }
-
-        # Box space -> DiagGaussian OR Deterministic.
-        if isinstance(action_space, Box):
-            if action_space.dtype.char in np.typecodes["AllInteger"]:
-                raise ValueError(
-                    "Box(..., `int`) action spaces are not supported. "
-                    "Use MultiDiscrete  or Box(..., `float`)."
-                )
+        handler = _ACTION_SPACE_HANDLERS.get(type(action_space))
+        if handler is None:
+            # Subclasses of the supported spaces -> Fall back to isinstance checks.
+            for space_type, space_handler in _ACTION_SPACE_HANDLERS.items():
+                if isinstance(action_space, space_type):
+                    handler = space_handler
+                    break
+            # Unknown type -> Error.
             else:
-                if len(action_space.shape) > 1:
-                    raise UnsupportedSpaceException(
-                        "Action space has multiple dimensions "
-                        "{}. ".format(action_space.shape)
-                        + "Consider reshaping this into a single dimension, "
-                        "using a custom action distribution, "
-                        "using a Tuple action space, or the multi-agent API."
-                    )
-                if deterministic:
-                    return distribution_dicts["deterministic"]
-                else:
-                    return distribution_dicts["gaussian"]
-
-        # Discrete Space -> Categorical.
-        elif isinstance(action_space, Discrete):
-            return distribution_dicts["categorical"]
-
-        # Tuple/Dict Spaces -> MultiAction.
-        elif isinstance(action_space, (Tuple, Dict)):
-            # TODO(Artur): Supported Tuple/Dict.
-            raise NotImplementedError("Tuple/Dict spaces not yet supported.")
-
-        # Simplex -> Dirichlet.
-        elif isinstance(action_space, Simplex):
-            # TODO(Artur): Supported Simplex (in torch).
-            raise NotImplementedError("Simplex action space not yet supported.")
-
-        # MultiDiscrete -> MultiCategorical.
-        elif isinstance(action_space, MultiDiscrete):
-            # TODO(Artur): Support multi-discrete.
-            raise NotImplementedError("MultiDiscrete spaces not yet supported.")
-
-        # Unknown type -> Error.
-        else:
-            raise NotImplementedError(f"Unsupported action space: `{action_space}`")
+                raise NotImplementedError(f"Unsupported action space: `{action_space}`")
+        # Hand out a plain (copyable and picklable) dict, not the shared constant.
+        # MappingProxyType.copy() returns a copy of the underlying dict.
+        return handler(action_space, deterministic).copy()
 
     def get_action_dist_cls(self, framework: str):
         """Get the action distribution class.
@@ -1,4 +1,6 @@
+import copy
 import itertools
+import pickle
 import unittest
 
 import gymnasium as gym
@@ -6,6 +8,7 @@ import numpy as np
 import tree
 from gymnasium.spaces import Box, Discrete
 from collections import namedtuple
+from unittest.mock import patch
 
 from ray.rllib.core.models.base import STATE_IN, ENCODER_OUT, STATE_OUT
 from ray.rllib.core.models.catalog import Catalog
@@ -186,6 +189,97 @@ class TestCatalog(unittest.TestCase):
         # TODO(Artur): Add support for composite spaces and test here
         # Today, Catalog does not handle composite spaces, so we can't test them
 
+    def test_default_conv_filters_not_shared(self):
+        """Tests that default conv filters are not shared between encoder configs."""
+        input_space = Box(-1.0, 1.0, (84, 84, 1), dtype=np.float32)
+        config = Catalog.get_encoder_config(
+            observation_space=input_space, model_config_dict={}
+        )
+        expected_filters = copy.deepcopy(config.filter_specifiers)
+        config.filter_specifiers.append([1, [1, 1], 1])
+        config.filter_specifiers[0][1].append(7)
+        config = Catalog.get_encoder_config(
+            observation_space=input_space,
+            model_config_dict={"fcnet_activation": "relu"},
+        )
+        self.assertEqual(config.filter_specifiers, expected_filters)
+
+    def test_overridden_get_encoder_config(self):
+        """Tests that Catalog uses get_encoder_config() overrides of subclasses."""
+
+        class MyCatalog(Catalog):
+            @classmethod
+            def get_encoder_config(
+                cls,
+                observation_space,
+                model_config_dict,
+                action_space=None,
+                view_requirements=None,
+            ):
+                return MLPEncoderConfig(
+                    input_dim=observation_space.shape[0],
+                    hidden_layer_dims=[],
+                    output_dim=model_config_dict["fcnet_hiddens"][-1] * 2,
+                )
+
+        catalog = MyCatalog(
+            observation_space=Box(-1.0, 1.0, (5,), dtype=np.float32),
+            action_space=Discrete(3),
+            model_config_dict={"fcnet_hiddens": [8]},
+        )
+        self.assertEqual(catalog.encoder_config.output_dim, 16)
+        self.assertEqual(catalog.latent_dim, 16)
+
+    def test_init_reuses_merged_model_config_dict(self):
+        """Tests that Catalog does not merge its model config with defaults twice."""
+        for input_space, model_config_dict in [
+            (Box(-1.0, 1.0, (5,), dtype=np.float32), {"fcnet_hiddens": [8, 8]}),
+            (Box(-1.0, 1.0, (84, 84, 1), dtype=np.float32), {}),
+        ]:
+            with patch.object(
+                Catalog,
+                "_get_encoder_config_from_merged",
+                wraps=Catalog._get_encoder_config_from_merged,
+            ) as get_encoder_config_from_merged:
+                catalog = Catalog(
+                    observation_space=input_space,
+                    action_space=gym.spaces.Box(1, 1, (1,)),
+                    model_config_dict=model_config_dict,
+                )
+            # The encoder config is built from the Catalog's own merged dict.
+            get_encoder_config_from_merged.assert_called_once()
+            self.assertIs(
+                get_encoder_config_from_merged.call_args.kwargs["model_config_dict"],
+                catalog.model_config_dict,
+            )
+            self.assertEqual(
+                catalog.model_config_dict, {**MODEL_DEFAULTS, **model_config_dict}
+            )
+            # The result is the same as for the public, un-merged code path.
+            self.assertEqual(
+                catalog.encoder_config,
+                Catalog.get_encoder_config(
+                    observation_space=input_space, model_config_dict=model_config_dict
+                ),
+            )
+
+    def test_catalog_can_be_copied(self):
+        """Tests that Catalogs (e.g. inside RLModule configs) can be copied."""
+        catalog = Catalog(
+            observation_space=Box(-1.0, 1.0, (5,), dtype=np.float32),
+            action_space=Discrete(3),
+            model_config_dict={},
+        )
+        self.assertIs(type(catalog.action_dist_cls_dict), dict)
+        for catalog_copy in [
+            copy.deepcopy(catalog),
+            pickle.loads(pickle.dumps(catalog)),
+        ]:
+            self.assertEqual(
+                catalog_copy.action_dist_cls_dict, catalog.action_dist_cls_dict
+            )
+            self.assertEqual(catalog_copy.encoder_config, catalog.encoder_config)
+
     def test_get_action_dist_cls_dict(self):
         """Tests if we can create a bunch of action distributions.
 